@@ -19,30 +19,59 @@ License: Open Source - MIT
 """
 
 import argparse
-import atexit
-import getpass
 import json
+import mmap
 import os
+import re
+import selectors
 import subprocess
 import sys
-import tempfile
-import threading
 import time
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from stat import S_ISDIR, S_ISREG, S_ISVTX
+from typing import List, Dict, Optional, Any, Tuple
+
+# Optional: orjson parses large Ansible JSON reports much faster than the stdlib.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Constants
 AUDIT_LOG_FILE = "audit_history.log"
 PLAYBOOK_FILE = "sentinel_drift.yml"
-DRIFT_TASKS = [
+PIPE_READ_SIZE = 1 << 20  # Read Ansible output in 1 MiB chunks
+VAULT_HELPER_SCRIPT = "#!/bin/sh\necho \"$SENTINEL_VAULT_PASS\"\n"
+DRIFT_TASKS = frozenset({
     "Display Diff",
     "Display Metadata Drift",
     "Display Missing File Warning",
     "Display Vault Error"
-]
-FIX_TASKS = [
+})
+FIX_TASKS = frozenset({
     "Display Fix Applied"
-]
+})
+
+# Text that only appears in the JSON output when a drift/fix message task actually ran
+# (skipped tasks carry no 'msg'). Keep in sync with tasks/display_results.yml and
+# tasks/remediate_drift.yml.
+REPORT_MARKERS = (
+    b"DRIFT DETECTED on ",
+    b"METADATA DRIFT on ",
+    b"FILE MISSING on ",
+    b"VAULT ERROR on ",
+    b"FIXED: "
+)
+
+# File path in a drift message: "File: /path" or "FILE MISSING on host: /path".
+# The host part is non-greedy rather than colon-free so IPv6 or "db:primary"
+# style inventory names still match up to the first ": ".
+DRIFT_FILE_RE = re.compile(r'(?:^File:|FILE MISSING on .*?:) (.+)$', re.MULTILINE)
+
+# Audit summary status severity: a host keeps the most severe status seen in the run
+STATUS_PRIORITY = {'OK': 0, 'FIXED': 1, 'DRIFT': 2}
 
 
 class Colors:
@@ -57,50 +86,85 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+    @classmethod
+    def disable(cls):
+        """Blank out every color code, for output that is not a terminal."""
+        for name in [name for name in vars(cls) if name.isupper()]:
+            setattr(cls, name, '')
+
+
+# Keep escape codes out of piped or redirected output (e.g. CI logs)
+if not sys.stdout.isatty():
+    Colors.disable()
+
+# Pre-formatted report lines, filled in per host with str.format()
+FMT_OK = f"{Colors.GREEN}✅ {{}}: OK (Compliant){Colors.ENDC}\n"
+FMT_UNREACHABLE = f"{Colors.FAIL}❌ {{}}: UNREACHABLE{Colors.ENDC}\n"
+FMT_FAILED = f"{Colors.FAIL}❌ {{}}: FAILED{Colors.ENDC}\n"
+FMT_FIXED = f"{Colors.GREEN}🔧 {{}}: FIXED{Colors.ENDC}\n"
+FMT_FIX_MSG = f"{Colors.GREEN}    {{}}{Colors.ENDC}\n"
+FMT_DRIFT = f"{Colors.FAIL}⚠️  {{}}: DRIFT DETECTED{Colors.ENDC}\n"
+FMT_DRIFT_MSG = f"{Colors.WARNING}{{}}{Colors.ENDC}\n"
+FMT_LOG_FIXED = f"{Colors.GREEN}✅ {{}}: DRIFT FIXED{Colors.ENDC}\n"
+FMT_LOG_FIXED_MSG = f"{Colors.CYAN}    {{}}{Colors.ENDC}\n"
+FMT_LOG_DRIFT_MSG = f"{Colors.WARNING}    {{}}{Colors.ENDC}\n"
+
 
 class Spinner:
     """
     A simple terminal spinner to indicate background activity.
-    Runs in a separate thread to not block the main execution flow.
+    It has no thread of its own: the waiting code calls tick() from its loop.
+    The spinner is disabled when stdout is not a terminal (e.g. piped to a log).
     """
+    CHARS = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    INTERVAL = 0.1  # Seconds between frames
+
     def __init__(self, message: str = "Processing..."):
         self.message = message
-        self.stop_running = False
-        self.thread: Optional[threading.Thread] = None
-
-    def spin(self):
-        """Cycle through spinner characters until stopped."""
-        chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        i = 0
-        while not self.stop_running:
-            sys.stdout.write(f"\r{Colors.CYAN}{chars[i % len(chars)]}{Colors.ENDC} {self.message}")
-            sys.stdout.flush()
-            time.sleep(0.1)
-            i += 1
+        self.running = False
+        self.enabled = sys.stdout.isatty()
+        # Pre-render every frame so each tick is a single write() call
+        self.frames = [f"\r{Colors.CYAN}{c}{Colors.ENDC} {message}".encode() for c in self.CHARS]
+        self.index = 0
+        self.last_tick = 0.0
 
     def start(self):
-        """Start the spinner thread."""
-        self.stop_running = False
-        self.thread = threading.Thread(target=self.spin)
-        self.thread.start()
+        """Show the spinner and draw its first frame."""
+        if not self.enabled:
+            return
 
-    def stop(self):
-        """Stop the spinner thread and clear the line."""
-        self.stop_running = True
-        if self.thread:
-            self.thread.join()
-        # Clear the line after stopping
-        sys.stdout.write("\r" + " " * (len(self.message) + 2) + "\r")
+        # Frames bypass sys.stdout, so push out anything still buffered first
         sys.stdout.flush()
+        self.running = True
+        self.tick()
+
+    def tick(self):
+        """Draw the next frame if at least INTERVAL has passed since the last one."""
+        if not self.running:
+            return
+
+        now = time.monotonic()
+        if now - self.last_tick < self.INTERVAL:
+            return
+
+        os.write(sys.stdout.fileno(), self.frames[self.index % len(self.frames)])
+        self.index += 1
+        self.last_tick = now
+
+    def stop(self):
+        """Clear the spinner line."""
+        if self.running:
+            self.running = False
+            os.write(sys.stdout.fileno(), ("\r" + " " * (len(self.message) + 2) + "\r").encode())
 
 
 def setup_vault_password(vault_pass_arg: Optional[str], cmd_list: List[str]) -> Optional[str]:
     """
     Securely handles the Ansible Vault password.
 
-    If a password is provided (or prompted), it creates a temporary helper script
-    that echoes the password from an environment variable. This avoids writing
-    the password to disk in plain text.
+    If a password is provided (or prompted), it points Ansible to a cached helper
+    script that echoes the password from an environment variable. This avoids
+    writing the password to disk in plain text.
 
     Args:
         vault_pass_arg: The argument provided via CLI (None, value, or '__PROMPT__').
@@ -114,28 +178,156 @@ def setup_vault_password(vault_pass_arg: Optional[str], cmd_list: List[str]) ->
 
     vault_password_value = vault_pass_arg
     if vault_pass_arg == '__PROMPT__':
+        import getpass
         vault_password_value = getpass.getpass(f"{Colors.BLUE}Vault password: {Colors.ENDC}")
 
-    # Create a temporary helper script (0o700 permissions)
-    # This script simply echoes the environment variable SENTINEL_VAULT_PASS
+    cmd_list.extend(["--vault-password-file", get_vault_helper()])
+
+    return vault_password_value
+
+
+def get_vault_helper() -> str:
+    """
+    Returns the path of the vault password helper script.
+
+    The helper simply echoes the environment variable SENTINEL_VAULT_PASS and holds
+    no secret itself, so it is cached and reused across runs. If the cache cannot
+    be used (read-only or missing home, or a location other users could tamper
+    with), a one-off temporary helper is created instead.
+
+    Returns:
+        The path of the executable helper script.
+    """
+    try:
+        return get_cached_vault_helper()
+    except OSError:
+        return create_temp_vault_helper()
+
+
+def is_private(st: os.stat_result) -> bool:
+    """Checks that a file is owned by the current user and not writable by anyone else."""
+    return st.st_uid == os.getuid() and st.st_mode & 0o022 == 0
+
+
+def get_cached_vault_helper() -> str:
+    """
+    Returns the cached helper script, (re)writing it if needed.
+
+    Ansible runs the helper with the vault password in its environment, so the
+    cache directory and the script must be private to the current user.
+
+    Raises:
+        OSError: If the cache cannot be created or is not safe to use.
+    """
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    cache_dir = os.path.join(cache_root, 'sentinel-drift')
+    helper_path = os.path.join(cache_dir, 'vault-helper.sh')
+
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    # Other users must not be able to swap the directory itself (a shared parent needs the sticky bit)
+    root_st = os.stat(cache_root)
+    if root_st.st_uid not in (0, os.getuid()) or (root_st.st_mode & 0o022 and not root_st.st_mode & S_ISVTX):
+        raise PermissionError(f"Cache location is not safe: {cache_root}")
+
+    dir_st = os.lstat(cache_dir)
+    if not S_ISDIR(dir_st.st_mode) or not is_private(dir_st):
+        raise PermissionError(f"Cache directory is not private: {cache_dir}")
+
+    # Reuse the cached helper as long as it is intact and still private
+    try:
+        helper_st = os.lstat(helper_path)
+        if S_ISREG(helper_st.st_mode) and is_private(helper_st) and os.access(helper_path, os.X_OK):
+            with open(helper_path) as f:
+                if f.read() == VAULT_HELPER_SCRIPT:
+                    return helper_path
+    except FileNotFoundError:
+        pass
+
+    import tempfile
+
+    # Write to a temporary file first so concurrent runs never execute a partial script
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.sh')
+    with os.fdopen(fd, 'w') as f:
+        f.write(VAULT_HELPER_SCRIPT)
+
+    # Make it executable and readable only by the owner
+    os.chmod(tmp_path, 0o700)
+    os.replace(tmp_path, helper_path)
+
+    return helper_path
+
+
+def create_temp_vault_helper() -> str:
+    """
+    Creates a one-off helper script in the temp directory, removed on exit.
+
+    Returns:
+        The path of the executable helper script.
+    """
+    import atexit
+    import tempfile
+
     fd, vault_pass_file = tempfile.mkstemp(suffix='.sh')
     with os.fdopen(fd, 'w') as f:
-        f.write("#!/bin/sh\n")
-        f.write("echo \"$SENTINEL_VAULT_PASS\"\n")
+        f.write(VAULT_HELPER_SCRIPT)
 
     # Make it executable and readable only by the owner
     os.chmod(vault_pass_file, 0o700)
 
-    cmd_list.extend(["--vault-password-file", vault_pass_file])
-
     # Register cleanup to remove the temp file on exit
     def cleanup_vault_file():
-        if vault_pass_file and os.path.exists(vault_pass_file):
+        if os.path.exists(vault_pass_file):
             os.remove(vault_pass_file)
-    
+
     atexit.register(cleanup_vault_file)
 
-    return vault_password_value
+    return vault_pass_file
+
+
+def run_ansible_quiet(cmd: List[str], env: Dict[str, str], spinner: Optional[Spinner] = None) -> subprocess.CompletedProcess:
+    """
+    Runs Ansible with stdout/stderr piped back to the wrapper (Quiet Mode).
+
+    Both pipes are drained with large os.read() calls into growing buffers,
+    so a multi-megabyte JSON report is collected in a few reads. The wait
+    times out every Spinner.INTERVAL so the same loop also animates the spinner.
+
+    On interruption the playbook is terminated and waited for, giving Ansible
+    a chance to clean up its temporary (decrypted) files before we exit.
+
+    Returns:
+        A CompletedProcess holding the return code and the raw stdout/stderr bytes.
+    """
+    with subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        stdout_fd = proc.stdout.fileno()
+        stderr_fd = proc.stderr.fileno()
+        buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                for fd in buffers:
+                    selector.register(fd, selectors.EVENT_READ)
+
+                timeout = Spinner.INTERVAL if spinner else None
+                while selector.get_map():
+                    for key, _ in selector.select(timeout):
+                        chunk = os.read(key.fd, PIPE_READ_SIZE)
+                        if chunk:
+                            buffers[key.fd] += chunk
+                        else:
+                            selector.unregister(key.fd)
+
+                    if spinner:
+                        spinner.tick()
+
+            proc.wait()
+        except KeyboardInterrupt:
+            proc.terminate()
+            proc.wait()
+            raise
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, bytes(buffers[stdout_fd]), bytes(buffers[stderr_fd]))
 
 
 def perform_safety_checks(args: argparse.Namespace):
@@ -165,93 +357,239 @@ def perform_safety_checks(args: argparse.Namespace):
                 sys.exit(1)
 
 
-def parse_ansible_json(json_output: str):
-    """
-    Parses the JSON output from Ansible (used in Quiet/Audit mode)
-    and prints a human-readable summary to the console.
+def collect_host_messages(stats: Dict[str, Any], plays: List[Dict[str, Any]]) -> Tuple[List[List[str]], List[List[str]]]:
     """
-    try:
-        data = json.loads(json_output)
-    except json.JSONDecodeError:
-        print(f"{Colors.FAIL}❌ Failed to parse Ansible JSON output.{Colors.ENDC}")
-        return
+    Walks the Ansible plays task by task and keeps only the drift and fix
+    messages reported for each host.
 
-    stats = data.get('stats', {})
-    plays = data.get('plays', [])
+    Args:
+        stats: The 'stats' section of the Ansible JSON output (one key per host).
+        plays: The 'plays' section of the Ansible JSON output.
 
-    print(f"\n{Colors.HEADER}=== 🛡️  Sentinel-Drift Report ==={Colors.ENDC}\n")
+    Returns:
+        A (host_drifts, host_fixes) tuple of message lists, one per host,
+        indexed in the order of 'stats'.
+    """
+    # Give each host a compact index so every event is one dict probe plus a list index
+    host_index = {host: i for i, host in enumerate(stats)}
+    host_drifts: List[List[str]] = [[] for _ in host_index]
+    host_fixes: List[List[str]] = [[] for _ in host_index]
 
-    # Initialize drift tracking
-    host_drifts: Dict[str, List[str]] = {host: [] for host in stats.keys()}
-    host_fixes: Dict[str, List[str]] = {host: [] for host in stats.keys()}
+    # Bind globals to locals: this loop runs once per task per host
+    drift_tasks = DRIFT_TASKS
+    fix_tasks = FIX_TASKS
+    empty: Dict[str, Any] = {}
 
     # Iterate through plays and tasks to find specific drift messages
     for play in plays:
-        for task in play.get('tasks', []):
-            task_name = task.get('task', {}).get('name', '')
-
-            if task_name in DRIFT_TASKS:
-                for host, result in task.get('hosts', {}).items():
-                    if not result.get('skipped', False):
-                        msg = result.get('msg', '')
-                        host_drifts[host].append(msg)
-            
-            elif task_name in FIX_TASKS:
-                for host, result in task.get('hosts', {}).items():
-                    if not result.get('skipped', False):
-                        msg = result.get('msg', '')
-                        host_fixes[host].append(msg)
+        for task in play.get('tasks', ()):
+            task_name = (task.get('task') or empty).get('name', '')
+
+            if task_name in drift_tasks:
+                target = host_drifts
+            elif task_name in fix_tasks:
+                target = host_fixes
+            else:
+                continue
+
+            for host, result in (task.get('hosts') or empty).items():
+                if not result.get('skipped', False):
+                    i = host_index.get(host)
+                    if i is not None:
+                        target[i].append(result.get('msg', ''))
+
+    return host_drifts, host_fixes
+
+
+def parse_stats_tail(json_output: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parses only the trailing 'stats' section of the Ansible JSON output.
+
+    The json callback sorts its keys, so 'stats' is the last top-level key
+    and the per-host summary can be read without parsing any task results.
+
+    Returns:
+        The stats mapping, or None if the output does not end as expected.
+    """
+    start = json_output.rfind(b'"stats":')
+    end = json_output.rfind(b'}')
+    if start < 0 or end < start:
+        return None
+
+    try:
+        stats = _json_loads(json_output[start + len(b'"stats":'):end])
+    except ValueError:
+        return None
+
+    return stats if isinstance(stats, dict) else None
+
+
+def parse_ansible_json(json_output: bytes, returncode: int = 0):
+    """
+    Parses the JSON output from Ansible (used in Quiet/Audit mode)
+    and prints a human-readable summary to the console.
+
+    Args:
+        json_output: Raw Ansible stdout, passed as bytes so orjson can parse it without decoding.
+        returncode: The ansible-playbook exit code. A clean run whose output holds
+                    no drift or fix message skips the full parse.
+    """
+    stats = None
+    if returncode == 0 and not any(marker in json_output for marker in REPORT_MARKERS):
+        # Every host is compliant: only the host list from the stats is needed
+        stats = parse_stats_tail(json_output)
+
+    if stats is not None:
+        host_drifts: List[List[str]] = [[] for _ in stats]
+        host_fixes: List[List[str]] = [[] for _ in stats]
+    else:
+        try:
+            data = _json_loads(json_output)
+        except ValueError:
+            print(f"{Colors.FAIL}❌ Failed to parse Ansible JSON output.{Colors.ENDC}")
+            return
+
+        stats = data.get('stats', {})
+        host_drifts, host_fixes = collect_host_messages(stats, data.get('plays', []))
+
+        # Only the per-host messages are needed from here on; release the task tree
+        del data
+
+    # Build the whole report first and write it out in one go
+    out = [f"\n{Colors.HEADER}=== 🛡️  Sentinel-Drift Report ==={Colors.ENDC}\n\n"]
 
     # Display Final Summary
-    for host, stat in stats.items():
+    for i, (host, stat) in enumerate(stats.items()):
         if stat.get('unreachable', 0) > 0:
-            print(f"{Colors.FAIL}❌ {host}: UNREACHABLE{Colors.ENDC}")
+            out.append(FMT_UNREACHABLE.format(host))
             continue
 
         if stat.get('failures', 0) > 0:
-            print(f"{Colors.FAIL}❌ {host}: FAILED{Colors.ENDC}")
+            out.append(FMT_FAILED.format(host))
             continue
 
-        drifts = host_drifts.get(host, [])
-        fixes = host_fixes.get(host, [])
+        drifts = host_drifts[i]
+        fixes = host_fixes[i]
 
         if not drifts and not fixes:
-            print(f"{Colors.GREEN}✅ {host}: OK (Compliant){Colors.ENDC}")
+            out.append(FMT_OK.format(host))
             continue
 
         # If we have fixes, show them
         if fixes:
-            print(f"{Colors.GREEN}🔧 {host}: FIXED{Colors.ENDC}")
+            out.append(FMT_FIXED.format(host))
             for msg in fixes:
-                print(f"{Colors.GREEN}    {msg}{Colors.ENDC}")
+                out.append(FMT_FIX_MSG.format(msg))
         
-        # Filter out drifts that were fixed
-        fixed_files = []
-        for fmsg in fixes:
-            # msg is "✅ FIXED: /path/to/file"
-            if "FIXED: " in fmsg:
-                fixed_files.append(fmsg.split("FIXED: ")[1].strip())
-        
-        remaining_drifts = []
-        for dmsg in drifts:
-            # Check if this drift message relates to a fixed file
-            is_fixed = False
-            for ffile in fixed_files:
-                if ffile in dmsg:
-                    is_fixed = True
-                    break
-            if not is_fixed:
-                remaining_drifts.append(dmsg)
+        # Filter out drifts that were fixed (msg is "✅ FIXED: /path/to/file")
+        fixed_files = {fmsg.split("FIXED: ", 1)[1].strip() for fmsg in fixes if "FIXED: " in fmsg}
+
+        # Single pass over the drifts; a message whose file the regex cannot
+        # identify falls back to a substring check against the fixed files
+        remaining_drifts = [
+            dmsg for dmsg in drifts
+            if not (
+                match.group(1).strip() in fixed_files
+                if (match := DRIFT_FILE_RE.search(dmsg))
+                else any(ffile in dmsg for ffile in fixed_files)
+            )
+        ]
 
         if remaining_drifts:
-            print(f"{Colors.FAIL}⚠️  {host}: DRIFT DETECTED{Colors.ENDC}")
+            out.append(FMT_DRIFT.format(host))
             for msg in remaining_drifts:
-                # Indent the message for better readability
-                formatted_msg = "\n".join([f"    {line}" for line in msg.splitlines()])
-                print(f"{Colors.WARNING}{formatted_msg}{Colors.ENDC}")
-            print("")  # Empty line separator
+                # Indent every line of the message for better readability
+                formatted_msg = "    " + msg.rstrip("\n").replace("\n", "\n    ")
+                out.append(FMT_DRIFT_MSG.format(formatted_msg))
+            out.append("\n")  # Empty line separator
         elif fixes:
-            print("") # Empty line separator if only fixes shown
+            out.append("\n")  # Empty line separator if only fixes shown
+
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+
+
+def read_log_entry(line: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parses one JSON Lines audit log entry.
+
+    Returns:
+        The entry, or None for blank, corrupt or legacy (pre-JSONL) lines.
+    """
+    if not line.startswith(b"{"):
+        return None
+
+    try:
+        entry = _json_loads(line)
+    except ValueError:
+        return None
+
+    return entry if isinstance(entry, dict) else None
+
+
+def log_entry_time(line: bytes) -> Optional[str]:
+    """
+    Returns the timestamp of one audit log line, for the binary search.
+
+    Legacy (pre-JSONL) lines all predate the current run, so they are reported
+    as older than any timestamp instead of being skipped.
+
+    Returns:
+        The 'ts' string ('' for legacy lines), or None for blank or corrupt lines.
+    """
+    if line.startswith(b"["):
+        return ""
+
+    entry = read_log_entry(line)
+    if entry is None:
+        return None
+
+    ts = entry.get('ts')
+    return ts if isinstance(ts, str) else None
+
+
+def find_log_start(log: mmap.mmap, start_key: str) -> int:
+    """
+    Binary-searches the audit log for the first line logged at or after start_key.
+
+    The log is append-only and written in chronological order, so only a handful
+    of lines need to be read to skip the history from previous runs.
+
+    Args:
+        log: The memory-mapped audit log.
+        start_key: The timestamp to search for, as 'YYYY-MM-DDTHH:MM:SS'.
+
+    Returns:
+        The byte offset to start reading from.
+    """
+    size = len(log)
+
+    def first_line_start(pos: int) -> int:
+        # Offset of the first line beginning at or after pos
+        if pos == 0:
+            return 0
+        newline = log.find(b"\n", pos - 1)
+        return size if newline < 0 else newline + 1
+
+    def first_time_after(pos: int) -> Optional[str]:
+        # Timestamp of the first well-formed entry beginning at or after pos
+        log.seek(first_line_start(pos))
+        for line in iter(log.readline, b""):
+            log_time = log_entry_time(line)
+            if log_time is not None:
+                return log_time
+        return None
+
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        log_time = first_time_after(mid)
+        if log_time is None or log_time >= start_key:
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return first_line_start(lo)
 
 
 def parse_audit_log(start_time: datetime):
@@ -262,94 +600,77 @@ def parse_audit_log(start_time: datetime):
     Args:
         start_time: Only log entries after this time will be considered.
     """
-    if not os.path.exists(AUDIT_LOG_FILE):
+    # An empty log cannot be memory-mapped, and has nothing to report anyway
+    if not os.path.exists(AUDIT_LOG_FILE) or os.path.getsize(AUDIT_LOG_FILE) == 0:
         return
 
     print(f"\n{Colors.HEADER}=== 🛡️  Sentinel-Drift Report (Summary) ==={Colors.ENDC}\n")
 
     # Structure: host -> {'status': 'OK'|'DRIFT'|'FIXED', 'messages': []}
-    host_report: Dict[str, Dict[str, Any]] = {}
+    host_report: Dict[str, Dict[str, Any]] = defaultdict(lambda: {'status': 'OK', 'messages': []})
 
     try:
-        with open(AUDIT_LOG_FILE, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line.startswith("["):
+        # ISO timestamps sort chronologically, so entries are filtered with a
+        # plain string comparison instead of parsing dates
+        start_key = start_time.isoformat(timespec='seconds')
+
+        # Log Format (JSON Lines): {"ts": ..., "status": ..., "host": ..., "file": ..., "type": ..., "ref": ...}
+        with open(AUDIT_LOG_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            # Skip straight to the entries of the current run
+            log.seek(find_log_start(log, start_key))
+
+            for line in iter(log.readline, b""):
+                record = read_log_entry(line)
+                if record is None:
                     continue
 
-                # Extract and parse timestamp
-                try:
-                    # Log Format: [YYYY-MM-DD HH:MM:SS] [STATUS] ...
-                    ts_str = line.split("]")[0].strip("[")
-                    log_time = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-
-                    if log_time < start_time:
-                        continue
-                except ValueError:
+                # Skip entries from earlier runs, and malformed ones rather than the whole summary
+                ts = record.get('ts')
+                if not isinstance(ts, str) or ts < start_key:
                     continue
 
-                # Parse log content
-                parts = line.split("] ", 2)
-                if len(parts) < 2:
-                    continue
+                status = record.get('status')
+                host = record.get('host', "Unknown")
+                file_path = record.get('file', "Unknown")
+                drift_type = record.get('type', "Unknown")
+
+                entry = host_report[host]
+
+                # A host only moves up in severity: OK < FIXED < DRIFT
+                if STATUS_PRIORITY.get(status, 0) > STATUS_PRIORITY[entry['status']]:
+                    entry['status'] = status
 
-                status_part = parts[1]  # e.g., [DRIFT]
-                status = status_part.strip("[]")
-                details = parts[2] if len(parts) > 2 else ""
-
-                # Extract Host, File, and Type from details string
-                host = "Unknown"
-                file_path = "Unknown"
-                drift_type = "Unknown"
-
-                detail_parts = details.split(" | ")
-                for part in detail_parts:
-                    part = part.strip() # Clean up whitespace
-                    if part.startswith("Host: "):
-                        host = part.replace("Host: ", "")
-                    elif part.startswith("File: "):
-                        file_path = part.replace("File: ", "")
-                    elif part.startswith("Type: "):
-                        drift_type = part.replace("Type: ", "")
-
-                # Initialize host entry if missing
-                if host not in host_report:
-                    host_report[host] = {'status': 'OK', 'messages': []}
-
-                # Update status based on log entry
                 if status == 'DRIFT':
-                    host_report[host]['status'] = 'DRIFT'
                     msg = f"File: {file_path} (Type: {drift_type})"
                     if drift_type == 'vault_error':
                         msg += "\n    ⚠️  VAULT ERROR: Source file is encrypted but password was missing."
-                    host_report[host]['messages'].append(msg)
+                    entry['messages'].append(msg)
                 
                 elif status == 'FIXED':
-                    host_report[host]['status'] = 'FIXED'
-                    host_report[host]['messages'].append(f"File: {file_path} (FIXED)")
-                
-                elif status == 'OK':
-                    # Keep as OK unless already marked as DRIFT or FIXED
-                    pass
+                    entry['messages'].append(f"File: {file_path} (FIXED)")
 
     except Exception as e:
         print(f"{Colors.FAIL}Error parsing log for summary: {e}{Colors.ENDC}")
         return
 
-    # Render the summary to console
+    # Render the summary to console in a single write
+    out = []
     for host, data in host_report.items():
         status = data['status']
         if status == 'OK':
-            print(f"{Colors.GREEN}✅ {host}: OK (Compliant){Colors.ENDC}")
+            out.append(FMT_OK.format(host))
         elif status == 'FIXED':
-            print(f"{Colors.GREEN}✅ {host}: DRIFT FIXED{Colors.ENDC}")
+            out.append(FMT_LOG_FIXED.format(host))
             for msg in data['messages']:
-                print(f"{Colors.CYAN}    {msg}{Colors.ENDC}")
+                out.append(FMT_LOG_FIXED_MSG.format(msg))
         else:
-            print(f"{Colors.FAIL}⚠️  {host}: DRIFT DETECTED{Colors.ENDC}")
+            out.append(FMT_DRIFT.format(host))
             for msg in data['messages']:
-                print(f"{Colors.WARNING}    {msg}{Colors.ENDC}")
-        print("")
+                out.append(FMT_LOG_DRIFT_MSG.format(msg))
+        out.append("\n")
+
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
 
 
 def main():
@@ -457,7 +778,8 @@ def main():
         spinner.start()
 
         try:
-            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+            # Keep stdout as bytes: orjson parses it directly, no decode step needed
+            result = run_ansible_quiet(cmd, env, spinner)
         except KeyboardInterrupt:
             spinner.stop()
             print(f"\n{Colors.FAIL}🛑 Execution interrupted by user.{Colors.ENDC}")
@@ -466,14 +788,14 @@ def main():
             spinner.stop()
 
         # Handle fatal errors that prevent JSON output
-        if result.returncode != 0 and not result.stdout.strip().startswith("{"):
+        if result.returncode != 0 and not result.stdout.strip().startswith(b"{"):
             print(f"\n{Colors.FAIL}❌ Ansible execution failed:{Colors.ENDC}")
-            print(result.stderr)
-            print(result.stdout)
+            print(result.stderr.decode(errors='replace'))
+            print(result.stdout.decode(errors='replace'))
             sys.exit(result.returncode)
 
         # Parse and display the audit report
-        parse_ansible_json(result.stdout)
+        parse_ansible_json(result.stdout, result.returncode)
 
         if result.returncode != 0:
             sys.exit(result.returncode)